@@ -1,13 +1,25 @@
 """taskfile-to-tasks - Convert Taskfile.yml to tasks.json for VSCode or Zed."""
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 __author__ = "H3mul"
 __license__ = "MIT"
 
-from .converter import TaskfileToTasks, parse_yaml_option, merge_options
+if TYPE_CHECKING:
+    from .converter import TaskfileToTasks, merge_options, parse_yaml_option
 
 __all__ = [
     "TaskfileToTasks",
     "parse_yaml_option",
     "merge_options",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the converter on first access so the CLI can parse arguments first
+    if name in __all__:
+        from . import converter
+
+        return getattr(converter, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,10 +4,6 @@ import argparse
 import sys
 from typing import Optional
 
-import yaml
-
-from taskfile_to_tasks.converter import TaskfileToTasks
-
 
 def create_parser() -> argparse.ArgumentParser:
     """Create and return the argument parser.
@@ -120,6 +116,13 @@ Examples:
         "Example: 'reveal: silent'",
     )
 
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse the task command's output from earlier runs while the "
+        "Taskfile and its includes are unchanged",
+    )
+
     parser.add_argument(
         "--preview",
         action="store_true",
@@ -147,6 +150,8 @@ def main(argv: Optional[list] = None) -> int:
     parser = create_parser()
     args = parser.parse_args(argv)
 
+    from taskfile_to_tasks.converter import TaskfileToTasks
+
     try:
         converter = TaskfileToTasks(
             source_file=args.source,
@@ -157,6 +162,7 @@ def main(argv: Optional[list] = None) -> int:
             task_cmd=args.task_cmd,
             extra_zed_options=args.extra_zed_options,
             extra_vscode_options=args.extra_vscode_options,
+            use_cache=args.cache,
             verbose=args.verbose,
         )
 
@@ -173,10 +179,12 @@ def main(argv: Optional[list] = None) -> int:
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
-    except yaml.YAMLError as e:
-        print(f"Error parsing YAML: {e}", file=sys.stderr)
-        return 1
     except Exception as e:
+        # PyYAML is imported lazily, so it can only have raised if it is loaded
+        yaml = sys.modules.get("yaml")
+        if yaml is not None and isinstance(e, yaml.YAMLError):
+            print(f"Error parsing YAML: {e}", file=sys.stderr)
+            return 1
         print(f"Unexpected error: {e}", file=sys.stderr)
         if args.verbose:
             import traceback
@@ -5,16 +5,149 @@ This module contains the main TaskfileToTasks class for converting
 Taskfile.yml files to tasks.json format for various editors.
 """
 
+import copy
+import functools
+import hashlib
 import json
+import math
+import os
 import re
+import shutil
 import subprocess
+import warnings
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 try:
-    import yaml
+    import orjson
 except ImportError:
-    raise ImportError("PyYAML is required. Install it with: pip install PyYAML")
+    orjson = None  # type: ignore[assignment]
+
+# A single "key: value" option with a plain key, split into key and value
+_OPTION_RE = re.compile(r" *([A-Za-z_][\w.-]*) *: +(.*?) *\Z")
+# Plain string values that YAML is guaranteed to load as str
+_PLAIN_VALUE_RE = re.compile(r"[A-Za-z_/][\w./~+-]*\Z")
+_JSON_FLOAT_RE = re.compile(r"-?\d+\.\d+\Z")
+
+# Plain scalars that YAML resolves to booleans or null
+_YAML_CONSTANTS: Dict[str, Any] = {
+    **dict.fromkeys(["yes", "Yes", "YES", "on", "On", "ON"], True),
+    **dict.fromkeys(["true", "True", "TRUE"], True),
+    **dict.fromkeys(["no", "No", "NO", "off", "Off", "OFF"], False),
+    **dict.fromkeys(["false", "False", "FALSE"], False),
+    **dict.fromkeys(["null", "Null", "NULL", "~"], None),
+}
+
+# Default VSCode presentation options
+_VSCODE_DEFAULT_PRESENTATION: Dict[str, Any] = {
+    "echo": True,
+    "reveal": "always",
+    "focus": False,
+    "panel": "shared",
+}
+
+# Default Zed task options
+_ZED_DEFAULT_OPTIONS: Dict[str, Any] = {"use_new_terminal": True}
+
+# Taskfile names searched for in a directory, in order of preference
+_TASKFILE_NAMES = (
+    "Taskfile.yml",
+    "Taskfile.yaml",
+    "taskfile.yml",
+    "taskfile.yaml",
+    "taskfile.dist.yml",
+    "taskfile.dist.yaml",
+)
+
+# Includes nested deeper than this are not followed when fingerprinting
+_MAX_INCLUDE_DEPTH = 32
+
+
+def _import_yaml() -> Any:
+    """Import PyYAML on first use, keeping it off the CLI startup path.
+
+    It is only loaded to parse extra options that need the full YAML parser
+    and, when the on-disk cache is enabled, to follow the includes of
+    Taskfiles that declare any.
+
+    Returns:
+        The yaml module
+
+    Raises:
+        ImportError: If PyYAML is not installed
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("PyYAML is required. Install it with: pip install PyYAML")
+    return yaml
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_safe_loader() -> Any:
+    """Return the fastest available safe YAML loader class.
+
+    Resolved once per process, preferring the libyaml-backed CSafeLoader.
+    Warns once if PyYAML was built without libyaml. Only extra options that
+    need the full YAML parser and the on-disk cache get here, so plain
+    conversions never warn.
+
+    Returns:
+        yaml.CSafeLoader if available, otherwise yaml.SafeLoader
+    """
+    yaml = _import_yaml()
+    try:
+        return yaml.CSafeLoader
+    except AttributeError:
+        warnings.warn(
+            "PyYAML was built without libyaml; falling back to the slower "
+            "pure-Python YAML loader. Reinstall PyYAML with libyaml available "
+            "to use the C loader.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return yaml.SafeLoader
+
+
+def _parse_simple_option(option_str: str) -> Optional[Dict[str, Any]]:
+    """Parse a trivial "key: value" option without invoking the YAML loader.
+
+    Only handles YAML booleans and null, values that JSON and YAML load
+    identically (decimal numbers, double-quoted strings) and plain strings
+    that YAML would leave untouched.
+
+    Args:
+        option_str: A YAML key-value pair as a string
+
+    Returns:
+        A dictionary with the parsed key-value pair, or None if the option
+        needs the full YAML parser
+    """
+    match = _OPTION_RE.match(option_str)
+    if match is None or not option_str.isprintable():
+        return None
+
+    key, value = match.groups()
+    if key in _YAML_CONSTANTS or not value:
+        return None
+    if value in _YAML_CONSTANTS:
+        return {key: _YAML_CONSTANTS[value]}
+
+    try:
+        parsed = json.loads(value)
+    except json.JSONDecodeError:
+        if not _PLAIN_VALUE_RE.match(value):
+            return None
+        return {key: value}
+
+    if isinstance(parsed, (list, dict)):
+        return None
+    if isinstance(parsed, float) and not _JSON_FLOAT_RE.match(value):
+        return None
+    if isinstance(parsed, str) and "\\" in value:
+        return None
+    return {key: parsed}
 
 
 def parse_yaml_option(option_str: str) -> Dict[str, Any]:
@@ -33,16 +166,309 @@ def parse_yaml_option(option_str: str) -> Dict[str, Any]:
     Raises:
         ValueError: If the option string is not valid YAML or is not a key-value pair
     """
+    # Deep copy the cached result so callers are free to modify it, including
+    # nested lists and mappings
+    return copy.deepcopy(dict(_parse_yaml_option_cached(option_str)))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_option_cached(option_str: str) -> Mapping[str, Any]:
+    """Parse a YAML option string, memoizing the result.
+
+    The result is shared by every caller, so it must be copied before use.
+
+    Args:
+        option_str: A YAML key-value pair as a string
+
+    Returns:
+        A read-only mapping with the parsed key-value pair
+
+    Raises:
+        ValueError: If the option string is not valid YAML or is not a key-value pair
+    """
+    data = _parse_simple_option(option_str)
+    if data is not None:
+        return MappingProxyType(data)
+
+    loader = _yaml_safe_loader()
+    yaml = _import_yaml()
     try:
         # Wrap in braces to make it valid YAML
-        data = yaml.safe_load("{" + option_str + "}")
+        data = yaml.load("{" + option_str + "}", Loader=loader)
         if not isinstance(data, dict):
             raise ValueError(f"Option must be a valid key-value pair: {option_str}")
-        return data
+        return MappingProxyType(data)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML option: {option_str}\n{e}")
 
 
+def _find_git_root(start: Path) -> Optional[Path]:
+    """Find the enclosing git repository root without running git.
+
+    Looks for a .git entry, which is a directory in regular checkouts and a
+    file in worktrees and submodules.
+
+    Args:
+        start: Directory to start searching from
+
+    Returns:
+        Path to the repository root, or None if no .git entry was found
+    """
+    for directory in (start, *start.parents):
+        if (directory / ".git").exists():
+            return directory
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _git_root(cwd: str) -> Optional[Path]:
+    """Resolve the git repository root for a directory.
+
+    Looks for a .git entry first and only runs 'git rev-parse' if none is
+    found. Cached per directory for the lifetime of the process.
+
+    Args:
+        cwd: Directory to resolve the repository root for
+
+    Returns:
+        Path to the repository root, or None if not inside a git repository
+    """
+    git_root = _find_git_root(Path(cwd))
+    if git_root is not None:
+        return git_root
+
+    try:
+        output = subprocess.check_output(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return Path(output.strip())
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_task_cmd(path_env: str) -> Optional[str]:
+    """Find the first task runner executable available on a search path.
+
+    Cached per PATH value, so repeated lookups don't rescan the filesystem.
+
+    Args:
+        path_env: The PATH value to search
+
+    Returns:
+        The command name ('task' or 'go-task'), or None if neither is found
+    """
+    for cmd in ("task", "go-task"):
+        if shutil.which(cmd, path=path_env) is not None:
+            return cmd
+    return None
+
+
+def _cache_dir() -> Path:
+    """Return the directory used to cache task command output.
+
+    Returns:
+        $XDG_CACHE_HOME/taskfile-to-tasks, defaulting to ~/.cache/taskfile-to-tasks
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "taskfile-to-tasks"
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from raw UTF-8 bytes, using orjson when it is installed.
+
+    Args:
+        data: JSON document as bytes
+
+    Returns:
+        The parsed document
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    # Both parsers accept the raw UTF-8 bytes, no need to decode first
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_orjson_safe(value: Any) -> bool:
+    """Check that orjson serializes a value exactly like the json module.
+
+    orjson rejects integers wider than 64 bits, writes non-finite floats as
+    null, formats float exponents differently and serializes dates that the
+    json module rejects, so only values without those qualify.
+
+    Args:
+        value: The value to check
+
+    Returns:
+        True if both serializers produce identical output for the value
+    """
+    if value is None or isinstance(value, (str, bool)):
+        return True
+    if isinstance(value, int):
+        return -(2**63) <= value < 2**64
+    if isinstance(value, float):
+        return math.isfinite(value) and "e" not in repr(value)
+    if isinstance(value, list):
+        return all(_is_orjson_safe(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            _is_orjson_safe(key) and _is_orjson_safe(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+def _json_dumps(data: Any, use_orjson: bool = True) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when it is installed.
+
+    Both serializers produce the same bytes for values accepted by
+    _is_orjson_safe; anything else goes through the json module.
+
+    Args:
+        data: The document to serialize
+        use_orjson: Whether orjson may be used for this document
+
+    Returns:
+        The JSON document as bytes
+
+    Raises:
+        TypeError: If data contains values that can't be serialized
+        ValueError: If data contains circular references
+    """
+    if orjson is not None and use_orjson:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _taskfile_fingerprint(
+    taskfile: Path, seen: Optional[set] = None, depth: int = 0
+) -> Optional[List[Any]]:
+    """Collect the path, mtime and size of a Taskfile and all of its includes.
+
+    Included Taskfiles are followed recursively so that editing any of them
+    changes the fingerprint.
+
+    Args:
+        taskfile: Path to the Taskfile
+        seen: Resolved paths of Taskfiles already visited, to stop include cycles
+        depth: Include nesting depth of this Taskfile
+
+    Returns:
+        List of [path, mtime_ns, size] entries, or None if an include can't
+        be resolved without the task command (templated, remote or missing
+        paths, a Taskfile that fails to parse, or includes nested deeper
+        than _MAX_INCLUDE_DEPTH)
+    """
+    if depth > _MAX_INCLUDE_DEPTH:
+        return None
+    if seen is None:
+        seen = set()
+    resolved = taskfile.resolve()
+    if resolved in seen:
+        return []
+    seen.add(resolved)
+
+    try:
+        stat = taskfile.stat()
+        content = taskfile.read_bytes()
+    except OSError:
+        return None
+
+    entries: List[Any] = [[str(taskfile), stat.st_mtime_ns, stat.st_size]]
+    # Most Taskfiles have no includes, so skip parsing them entirely
+    if b"includes" not in content:
+        return entries
+
+    yaml = _import_yaml()
+    try:
+        data = yaml.load(content, Loader=_yaml_safe_loader())
+    except yaml.YAMLError:
+        return None
+
+    includes = data.get("includes") if isinstance(data, dict) else None
+    if not includes:
+        return entries
+    if not isinstance(includes, dict):
+        return None
+
+    for include in includes.values():
+        optional = False
+        if isinstance(include, dict):
+            optional = bool(include.get("optional"))
+            include = include.get("taskfile")
+        if not isinstance(include, str) or "{{" in include or "://" in include:
+            return None
+
+        path = Path(os.path.normpath(taskfile.parent / Path(include).expanduser()))
+        if path.is_dir():
+            candidates = (path / name for name in _TASKFILE_NAMES)
+            path = next((c for c in candidates if c.exists()), path)
+        if not path.is_file():
+            if not optional:
+                return None
+            entries.append([str(path), None, None])
+            continue
+
+        included = _taskfile_fingerprint(path, seen, depth + 1)
+        if included is None:
+            return None
+        entries.extend(included)
+
+    return entries
+
+
+def _task_locations(source_file: Path, tasks_data: List[Any]) -> List[str]:
+    """List the Taskfile and every Taskfile its tasks were loaded from.
+
+    Args:
+        source_file: Path to the main Taskfile
+        tasks_data: List of task dictionaries from the task command
+
+    Returns:
+        The main Taskfile followed by the distinct task locations
+    """
+    paths = {str(source_file): None}
+    for task in tasks_data:
+        location = task.get("location") if isinstance(task, dict) else None
+        taskfile = location.get("taskfile") if isinstance(location, dict) else None
+        if isinstance(taskfile, str):
+            paths[taskfile] = None
+    return list(paths)
+
+
+def _stat_taskfiles(paths: Iterable[str]) -> List[Any]:
+    """Collect the mtime and size of each Taskfile.
+
+    Args:
+        paths: Paths of the Taskfiles
+
+    Returns:
+        List of (mtime_ns, size) tuples, with None for missing files
+    """
+    stamps: List[Any] = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamps.append(None)
+        else:
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return stamps
+
+
 def merge_options(base: Dict[str, Any], extra: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Merge extra options into the base options dictionary.
 
@@ -74,6 +500,7 @@ class TaskfileToTasks:
         task_cmd: Optional[str] = None,
         extra_zed_options: Optional[List[str]] = None,
         extra_vscode_options: Optional[List[str]] = None,
+        use_cache: bool = False,
         verbose: bool = False,
     ):
         """Initialize the converter.
@@ -87,6 +514,8 @@ class TaskfileToTasks:
             task_cmd: Task command to use in generated tasks.json (defaults to auto-detected command)
             extra_zed_options: List of YAML option strings to merge with Zed tasks
             extra_vscode_options: List of YAML option strings to merge with VSCode presentation
+            use_cache: Reuse task command output cached on disk while the Taskfiles are
+                unchanged (vars, environment and dotenv files are not tracked)
             verbose: Enable verbose output
 
         Raises:
@@ -97,8 +526,9 @@ class TaskfileToTasks:
         if self.editor not in ("vscode", "zed"):
             raise ValueError("Editor must be 'vscode' or 'zed'")
 
-        self.skip_tasks = skip_tasks or []
+        self.skip_tasks = frozenset(skip_tasks or ())
         self.skip_task_patterns = self._compile_patterns(skip_task_patterns or [])
+        self.use_cache = use_cache
         self.verbose = verbose
         self.source_file = self._resolve_source_file(source_file)
         self.output_dir = self._resolve_output_dir(output_dir)
@@ -112,6 +542,34 @@ class TaskfileToTasks:
             extra_vscode_options or []
         )
 
+        # Merge editor options once; generated tasks share these dicts
+        self._vscode_presentation = merge_options(
+            _VSCODE_DEFAULT_PRESENTATION, self.extra_vscode_options
+        )
+        self._vscode_group = {"kind": "build", "isDefault": False}
+        self._zed_options = merge_options(_ZED_DEFAULT_OPTIONS, self.extra_zed_options)
+
+        # Tasks loaded from the task command, reused until a Taskfile changes
+        self._cached_tasks_data: Optional[List[Dict[str, Any]]] = None
+        self._cached_taskfiles: List[str] = []
+        self._cached_stamps: List[Any] = []
+        # Tasks extracted from the cached task data
+        self._extracted_tasks: Optional[List[Dict[str, Any]]] = None
+        self._extracted_from: Optional[List[Dict[str, Any]]] = None
+
+    def refresh(self) -> None:
+        """Discard cached task data so the next conversion reloads it.
+
+        Useful when inputs that aren't tracked by the cache changed, such as
+        variables, environment variables, dotenv files or included Taskfiles
+        that didn't define any tasks yet.
+        """
+        self._cached_tasks_data = None
+        self._cached_taskfiles = []
+        self._cached_stamps = []
+        self._extracted_tasks = None
+        self._extracted_from = None
+
     def _compile_patterns(self, patterns: List[str]) -> List[re.Pattern]:
         """Compile regex patterns for task filtering.
 
@@ -172,28 +630,15 @@ class TaskfileToTasks:
         Raises:
             RuntimeError: If neither command is found
         """
-        for cmd in ["task", "go-task"]:
-            try:
-                subprocess.run(
-                    [cmd, "--version"],
-                    capture_output=True,
-                    check=True,
-                    timeout=5,
-                )
-                self._log(f"Found task command: {cmd}")
-                return cmd
-            except (
-                subprocess.CalledProcessError,
-                FileNotFoundError,
-                PermissionError,
-                subprocess.TimeoutExpired,
-            ):
-                continue
+        cmd = _resolve_task_cmd(os.environ.get("PATH", os.defpath))
+        if cmd is None:
+            raise RuntimeError(
+                "Neither 'task' nor 'go-task' command found. "
+                "Please install go-task: https://taskfile.dev/installation"
+            )
 
-        raise RuntimeError(
-            "Neither 'task' nor 'go-task' command found. "
-            "Please install go-task: https://taskfile.dev/installation"
-        )
+        self._log(f"Found task command: {cmd}")
+        return cmd
 
     def _parse_extra_options(self, options: List[str]) -> List[Dict[str, Any]]:
         """Parse a list of YAML option strings.
@@ -227,7 +672,7 @@ class TaskfileToTasks:
             source_file: Optional explicit path to Taskfile.yml
 
         Returns:
-            Resolved Path to Taskfile.yml
+            Absolute Path to Taskfile.yml
 
         Raises:
             FileNotFoundError: If Taskfile.yml cannot be found
@@ -238,37 +683,22 @@ class TaskfileToTasks:
                 return path.resolve()
             raise FileNotFoundError(f"Taskfile not found: {source_file}")
 
-        # List of taskfile names to search for, in order of preference
-        taskfile_names = [
-            "Taskfile.yml",
-            "Taskfile.yaml",
-            "taskfile.yml",
-            "taskfile.yaml",
-            "taskfile.dist.yml",
-            "taskfile.dist.yaml",
-        ]
-
         # Try to find taskfile in git root
-        try:
-            git_root = subprocess.check_output(
-                ["git", "rev-parse", "--show-toplevel"],
-                stderr=subprocess.DEVNULL,
-                text=True,
-            ).strip()
-            for taskfile_name in taskfile_names:
-                taskfile = Path(git_root) / taskfile_name
+        git_root = _git_root(os.getcwd())
+        if git_root is not None:
+            for taskfile_name in _TASKFILE_NAMES:
+                taskfile = git_root / taskfile_name
                 if taskfile.exists():
                     self._log(f"Found {taskfile_name} in git root: {taskfile}")
-                    return taskfile.resolve()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
+                    return taskfile
 
         # Try current directory
-        for taskfile_name in taskfile_names:
-            taskfile = Path(taskfile_name)
+        cwd = Path.cwd()
+        for taskfile_name in _TASKFILE_NAMES:
+            taskfile = cwd / taskfile_name
             if taskfile.exists():
                 self._log(f"Found {taskfile_name} in current directory: {taskfile}")
-                return taskfile.resolve()
+                return taskfile
 
         raise FileNotFoundError(
             "Taskfile not found (searched for: Taskfile.yml, Taskfile.yaml, taskfile.yml, taskfile.yaml, taskfile.dist.yml, taskfile.dist.yaml). "
@@ -282,13 +712,13 @@ class TaskfileToTasks:
             output_dir: Optional explicit output directory
 
         Returns:
-            Resolved Path to output directory (created if necessary)
+            Path to output directory (created if necessary)
         """
         if output_dir:
             path = Path(output_dir)
             path.mkdir(parents=True, exist_ok=True)
             self._log(f"Using custom output directory: {path}")
-            return path.resolve()
+            return path
 
         if self.editor == "zed":
             path = Path(".zed")
@@ -297,13 +727,16 @@ class TaskfileToTasks:
 
         path.mkdir(parents=True, exist_ok=True)
         self._log(f"Using default output directory: {path}")
-        return path.resolve()
+        return path
 
     def _load_taskfile(self) -> List[Dict[str, Any]]:
         """Load all tasks using 'task --list-all --json' or 'go-task --list-all --json'.
 
         Runs the task command in the Taskfile's directory to get all tasks
-        including those from included Taskfiles.
+        including those from included Taskfiles. The result is kept and
+        reused while the Taskfile and the Taskfiles its tasks came from are
+        unchanged. When use_cache is enabled, it is also cached on disk
+        across runs.
 
         Returns:
             List of task dictionaries from task command output
@@ -312,35 +745,166 @@ class TaskfileToTasks:
             RuntimeError: If task command fails
             ValueError: If output is not valid JSON
         """
+        if (
+            self._cached_tasks_data is not None
+            and _stat_taskfiles(self._cached_taskfiles) == self._cached_stamps
+        ):
+            return self._cached_tasks_data
+
+        # Only the on-disk cache needs the includes, which takes a YAML parse
+        cache_key = None
+        if self.use_cache:
+            fingerprint = _taskfile_fingerprint(self.source_file)
+            if fingerprint is None:
+                self._log("Not caching task output: includes can't be resolved")
+            else:
+                cache_key = self._get_cache_key(fingerprint)
+        cache_file = self._get_cache_file()
+        tasks_data = None
+        if cache_key is not None:
+            tasks_data = self._read_cache(cache_file, cache_key)
+
+        if tasks_data is not None:
+            self._log(f"Loaded {len(tasks_data)} task(s) from cache: {cache_file}")
+        else:
+            tasks_data = self._parse_task_list(self._run_task_list())
+            self._log(f"Loaded {len(tasks_data)} task(s) from task command")
+            if cache_key is not None:
+                self._write_cache(cache_file, cache_key, tasks_data)
+
+        self._cached_tasks_data = tasks_data
+        self._cached_taskfiles = _task_locations(self.source_file, tasks_data)
+        self._cached_stamps = _stat_taskfiles(self._cached_taskfiles)
+        return tasks_data
+
+    def _run_task_list(self) -> bytes:
+        """Run 'task --list-all --json' in the Taskfile's directory.
+
+        Returns:
+            The raw JSON output of the task command
+
+        Raises:
+            RuntimeError: If task command fails
+        """
         try:
-            # Run task command in the Taskfile's directory
-            taskfile_dir = self.source_file.parent
             result = subprocess.run(
                 [self.task_command, "--list-all", "--json"],
-                cwd=taskfile_dir,
+                cwd=self.source_file.parent,
                 capture_output=True,
-                text=True,
                 check=True,
             )
-
-            tasks_data = json.loads(result.stdout)
-            if not isinstance(tasks_data, dict) or "tasks" not in tasks_data:
-                raise ValueError(
-                    "Expected task output to be a dictionary with 'tasks' key"
-                )
-            tasks_data = tasks_data["tasks"]
-            if not isinstance(tasks_data, list):
-                raise ValueError("Expected task output to be a list of tasks")
-
-            self._log(f"Loaded {len(tasks_data)} task(s) from task command")
-            return tasks_data
         except subprocess.CalledProcessError as e:
             raise RuntimeError(
-                f"Failed to run '{self.task_command} --list-all --json': {e.stderr}"
+                f"Failed to run '{self.task_command} --list-all --json': "
+                f"{e.stderr.decode(errors='replace')}"
             )
+        return result.stdout
+
+    def _parse_task_list(self, output: bytes) -> List[Dict[str, Any]]:
+        """Parse the JSON output of 'task --list-all --json'.
+
+        Args:
+            output: The raw JSON output of the task command
+
+        Returns:
+            List of task dictionaries
+
+        Raises:
+            ValueError: If output is not valid JSON or has an unexpected shape
+        """
+        try:
+            tasks_data = _json_loads(output)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON from task command: {e}")
 
+        if not isinstance(tasks_data, dict) or "tasks" not in tasks_data:
+            raise ValueError("Expected task output to be a dictionary with 'tasks' key")
+        tasks_data = tasks_data["tasks"]
+        if not isinstance(tasks_data, list):
+            raise ValueError("Expected task output to be a list of tasks")
+        return tasks_data
+
+    def _get_cache_key(self, fingerprint: List[Any]) -> List[Any]:
+        """Describe the inputs that the task command output depends on.
+
+        Args:
+            fingerprint: Fingerprint of the Taskfile and its includes
+
+        Returns:
+            The cache key, covering the task binary and the Taskfiles
+        """
+        # Upgrading the task binary may change its output
+        task_path = shutil.which(self.task_command)
+        try:
+            task_mtime_ns = os.stat(task_path).st_mtime_ns if task_path else None
+        except OSError:
+            task_mtime_ns = None
+
+        return [task_path, task_mtime_ns, fingerprint]
+
+    def _get_cache_file(self) -> Path:
+        """Return the on-disk cache file for this task command and Taskfile.
+
+        There is a single file per task command and Taskfile, overwritten
+        whenever its cache key changes, so edits don't accumulate entries.
+
+        Returns:
+            Path to the cache file
+        """
+        name = json.dumps([self.task_command, str(self.source_file)])
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()
+        return _cache_dir() / f"{digest}.json"
+
+    def _read_cache(
+        self, cache_file: Path, cache_key: List[Any]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Read cached tasks if they were stored under the same cache key.
+
+        Args:
+            cache_file: Path to the cache file
+            cache_key: The current cache key from '_get_cache_key'
+
+        Returns:
+            List of task dictionaries, or None on a cache miss or unreadable entry
+        """
+        try:
+            data = _json_loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("key") != cache_key:
+            return None
+        tasks_data = data.get("tasks")
+        return tasks_data if isinstance(tasks_data, list) else None
+
+    def _write_cache(
+        self,
+        cache_file: Path,
+        cache_key: List[Any],
+        tasks_data: List[Dict[str, Any]],
+    ) -> None:
+        """Atomically write tasks and their cache key to the cache.
+
+        Failures are ignored since the cache is only an optimization.
+
+        Args:
+            cache_file: Path to the cache file
+            cache_key: The cache key from '_get_cache_key'
+            tasks_data: List of task dictionaries from the task command
+        """
+        payload = json.dumps({"key": cache_key, "tasks": tasks_data})
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(payload.encode("utf-8"))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self._log(f"Could not write task cache {cache_file}: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
     def _extract_tasks(self, tasks_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Extract tasks from task command output.
 
@@ -356,22 +920,28 @@ class TaskfileToTasks:
         if not isinstance(tasks_data, list):
             raise ValueError("Expected tasks_data to be a list")
 
-        extracted = []
+        extracted: List[Dict[str, Any]] = []
+
+        # Bind loop-invariant lookups to locals for the per-task loop
+        should_skip = self._should_skip_task
+        log = self._log
+        append = extracted.append
+
         for task in tasks_data:
             if not isinstance(task, dict):
                 continue
 
             task_id = task.get("task", "")
-            if not task_id or self._should_skip_task(task_id):
+            if not task_id or should_skip(task_id):
                 if not task_id:
                     continue
-                self._log(f"Skipping task: {task_id}")
+                log(f"Skipping task: {task_id}")
                 continue
 
             # Extract description from task
             desc = task.get("desc", "")
 
-            extracted.append(
+            append(
                 {
                     "id": task_id,
                     "label": task_id,
@@ -381,6 +951,22 @@ class TaskfileToTasks:
 
         return extracted
 
+    def _get_extracted_tasks(
+        self, tasks_data: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Extract tasks, reusing the previous result for the same task data.
+
+        Args:
+            tasks_data: List of task dictionaries from '_load_taskfile'
+
+        Returns:
+            List of extracted task dictionaries
+        """
+        if self._extracted_tasks is None or self._extracted_from is not tasks_data:
+            self._extracted_tasks = self._extract_tasks(tasks_data)
+            self._extracted_from = tasks_data
+        return self._extracted_tasks
+
     def _generate_vscode_tasks(self, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate VSCode tasks.json format.
 
@@ -390,32 +976,27 @@ class TaskfileToTasks:
         Returns:
             Dictionary in VSCode tasks.json format
         """
-        vscode_tasks = []
-
-        # Default VSCode presentation options
-        default_options = {
-            "echo": True,
-            "reveal": "always",
-            "focus": False,
-            "panel": "shared",
-        }
+        vscode_tasks: List[Dict[str, Any]] = []
 
-        # Merge with extra options
-        presentation = merge_options(default_options, self.extra_vscode_options)
+        # Bind per-call constants to locals for the per-task loop
+        tasks_cmd = self.tasks_cmd
+        presentation = self._vscode_presentation
+        group = self._vscode_group
+        append = vscode_tasks.append
 
         for task in tasks:
             vscode_task = {
                 "label": task["label"],
                 "type": "shell",
-                "command": self.tasks_cmd,
+                "command": tasks_cmd,
                 "args": [task["id"]],
                 "presentation": presentation,
-                "group": {"kind": "build", "isDefault": False},
+                "group": group,
             }
             if task["description"]:
                 vscode_task["description"] = task["description"]
 
-            vscode_tasks.append(vscode_task)
+            append(vscode_task)
 
         return {
             "version": "2.0.0",
@@ -431,13 +1012,12 @@ class TaskfileToTasks:
         Returns:
             List of task dictionaries in Zed format
         """
-        zed_tasks = []
-
-        # Default Zed task options
-        default_options = {"use_new_terminal": True}
+        zed_tasks: List[Dict[str, Any]] = []
 
-        # Merge with extra options
-        extra_merged = merge_options(default_options, self.extra_zed_options)
+        # Bind per-call constants to locals for the per-task loop
+        tasks_cmd = self.tasks_cmd
+        extra_merged = self._zed_options
+        append = zed_tasks.append
 
         for task in tasks:
             task_label = (
@@ -445,16 +1025,15 @@ class TaskfileToTasks:
                 if task["description"]
                 else task["id"]
             )
+            # Extra options are unpacked last so they can override any key
             zed_task = {
                 "label": task_label,
-                "command": self.tasks_cmd,
+                "command": tasks_cmd,
                 "args": [task["id"]],
+                **extra_merged,
             }
 
-            # Merge extra options into each task
-            zed_task.update(extra_merged)
-
-            zed_tasks.append(zed_task)
+            append(zed_task)
 
         return zed_tasks
 
@@ -472,7 +1051,7 @@ class TaskfileToTasks:
         tasks_data = self._load_taskfile()
 
         print("Extracting tasks...")
-        tasks = self._extract_tasks(tasks_data)
+        tasks = self._get_extracted_tasks(tasks_data)
 
         if not tasks:
             print("Warning: No tasks found")
@@ -482,15 +1061,19 @@ class TaskfileToTasks:
 
         if self.editor == "vscode":
             output_data = self._generate_vscode_tasks(tasks)
+            options = self._vscode_presentation
         else:
             output_data = self._generate_zed_tasks(tasks)
+            options = self._zed_options
 
         output_file = self.output_dir / "tasks.json"
 
         # Write tasks.json
         print(f"Writing tasks to: {output_file}")
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2)
+        # Task fields are strings, so only the editor options can hold values
+        # that orjson would write differently
+        payload = _json_dumps(output_data, use_orjson=_is_orjson_safe(options))
+        output_file.write_bytes(payload)
 
         print(f"✓ Successfully generated {self.editor.upper()} tasks.json")
         return output_file
@@ -502,7 +1085,7 @@ class TaskfileToTasks:
             List of dictionaries with 'id' and 'description' keys
         """
         taskfile = self._load_taskfile()
-        tasks = self._extract_tasks(taskfile)
+        tasks = self._get_extracted_tasks(taskfile)
         return [
             {"id": task["id"], "description": task["description"]} for task in tasks
         ]
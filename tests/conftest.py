@@ -0,0 +1,43 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from taskfile_to_tasks import converter
+from taskfile_to_tasks.converter import TaskfileToTasks
+
+
+class TaskStub:
+    """Stand-in for the task command that records each invocation."""
+
+    def __init__(self):
+        self.output = b'{"tasks": [{"task": "build", "desc": "Build it"}]}'
+        self.calls = []
+
+
+@pytest.fixture
+def task_stub(monkeypatch, tmp_path):
+    """Replace the task command with a stub and keep caches inside tmp_path."""
+    stub = TaskStub()
+
+    def run_task_list(self):
+        stub.calls.append(self.source_file)
+        return stub.output
+
+    monkeypatch.setattr(converter, "_resolve_task_cmd", lambda path_env: "task")
+    monkeypatch.setattr(TaskfileToTasks, "_run_task_list", run_task_list)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return stub
+
+
+@pytest.fixture
+def make_converter(task_stub, tmp_path):
+    """Build converters for the Taskfile in a directory, tmp_path by default."""
+
+    def make(directory=tmp_path, **kwargs):
+        return TaskfileToTasks(
+            source_file=str(directory / "Taskfile.yml"),
+            output_dir=str(directory / ".zed"),
+            **kwargs,
+        )
+
+    return make
@@ -0,0 +1,237 @@
+"""Tests for caching the output of the task command."""
+
+import json
+import os
+import warnings
+
+import pytest
+import yaml
+
+from taskfile_to_tasks import converter
+from taskfile_to_tasks.converter import _taskfile_fingerprint
+
+def write(path, content):
+    """Write a file and move its mtime forward so every edit is visible."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    existed = path.exists()
+    mtime_ns = path.stat().st_mtime_ns if existed else 0
+    path.write_text(content)
+    if existed:
+        os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+
+@pytest.fixture
+def project(tmp_path, task_stub):
+    root = tmp_path / "project"
+    write(root / "Taskfile.yml", "version: '3'\nincludes:\n  sub: ./sub\n")
+    write(root / "sub" / "Taskfile.yml", "version: '3'\n")
+    task_stub.output = task_output(("sub:lint", root / "sub" / "Taskfile.yml"))
+    return root
+
+
+def task_output(*tasks):
+    """Build task command output for (task, taskfile) pairs."""
+    return json.dumps(
+        {
+            "tasks": [
+                {"task": task, "desc": "", "location": {"taskfile": str(taskfile)}}
+                for task, taskfile in tasks
+            ]
+        }
+    ).encode("utf-8")
+
+
+class TestTaskfileFingerprint:
+    def test_includes_are_followed(self, project):
+        fingerprint = _taskfile_fingerprint(project / "Taskfile.yml")
+        paths = [entry[0] for entry in fingerprint]
+        assert paths == [
+            str(project / "Taskfile.yml"),
+            str(project / "sub" / "Taskfile.yml"),
+        ]
+
+    def test_editing_an_include_changes_the_fingerprint(self, project):
+        before = _taskfile_fingerprint(project / "Taskfile.yml")
+        write(project / "sub" / "Taskfile.yml", "version: '3'\ntasks: {}\n")
+        assert _taskfile_fingerprint(project / "Taskfile.yml") != before
+
+    def test_include_cycle_is_followed_once(self, tmp_path):
+        write(tmp_path / "Taskfile.yml", "version: '3'\nincludes:\n  sub: ./sub\n")
+        write(tmp_path / "sub" / "Taskfile.yml", "version: '3'\nincludes:\n  up: ..\n")
+        fingerprint = _taskfile_fingerprint(tmp_path / "Taskfile.yml")
+        assert [entry[0] for entry in fingerprint] == [
+            str(tmp_path / "Taskfile.yml"),
+            str(tmp_path / "sub" / "Taskfile.yml"),
+        ]
+
+    def test_deeply_nested_includes_disable_caching(self, tmp_path):
+        directory = tmp_path
+        for _ in range(converter._MAX_INCLUDE_DEPTH + 2):
+            write(
+                directory / "Taskfile.yml", "version: '3'\nincludes:\n  sub: ./sub\n"
+            )
+            directory = directory / "sub"
+        write(directory / "Taskfile.yml", "version: '3'\n")
+        assert _taskfile_fingerprint(tmp_path / "Taskfile.yml") is None
+
+    def test_optional_missing_include_is_recorded(self, tmp_path):
+        taskfile = tmp_path / "Taskfile.yml"
+        write(
+            taskfile,
+            "version: '3'\nincludes:\n"
+            "  opt:\n    taskfile: ./missing.yml\n    optional: true\n",
+        )
+        fingerprint = _taskfile_fingerprint(taskfile)
+        assert fingerprint[1] == [str(tmp_path / "missing.yml"), None, None]
+
+    @pytest.mark.parametrize(
+        "include",
+        [
+            "./missing.yml",
+            "./Taskfile_{{OS}}.yml",
+            "https://example.com/Taskfile.yml",
+            "{taskfile: ./missing.yml}",
+        ],
+    )
+    def test_unresolvable_include_disables_caching(self, tmp_path, include):
+        taskfile = tmp_path / "Taskfile.yml"
+        write(taskfile, f"version: '3'\nincludes:\n  x: {include}\n")
+        assert _taskfile_fingerprint(taskfile) is None
+
+
+@pytest.fixture
+def no_libyaml(monkeypatch):
+    """Make PyYAML look like it was built without libyaml."""
+    monkeypatch.delattr(yaml, "CSafeLoader")
+    converter._yaml_safe_loader.cache_clear()
+    yield
+    converter._yaml_safe_loader.cache_clear()
+
+
+class TestInstanceCache:
+    def test_tasks_are_loaded_once(self, project, task_stub, make_converter):
+        tasks = make_converter(project)
+        tasks.get_tasks_summary()
+        tasks.convert()
+        assert len(task_stub.calls) == 1
+
+    def test_editing_an_include_reloads_tasks(self, project, task_stub, make_converter):
+        tasks = make_converter(project)
+        tasks.get_tasks_summary()
+        write(project / "sub" / "Taskfile.yml", "version: '3'\ntasks: {}\n")
+        tasks.convert()
+        assert len(task_stub.calls) == 2
+
+    def test_refresh_reloads_tasks(self, project, task_stub, make_converter):
+        tasks = make_converter(project)
+        tasks.get_tasks_summary()
+        tasks.refresh()
+        tasks.get_tasks_summary()
+        assert len(task_stub.calls) == 2
+
+    def test_editing_the_taskfile_reloads_tasks(
+        self, project, task_stub, make_converter
+    ):
+        tasks = make_converter(project)
+        tasks.get_tasks_summary()
+        write(project / "Taskfile.yml", "version: '3'\n")
+        tasks.get_tasks_summary()
+        assert len(task_stub.calls) == 2
+
+    def test_templated_include_is_tracked_by_task_location(
+        self, project, task_stub, make_converter
+    ):
+        write(project / "Taskfile.yml", "version: '3'\nincludes:\n  x: ./{{.X}}\n")
+        tasks = make_converter(project)
+        tasks.get_tasks_summary()
+        tasks.get_tasks_summary()
+        assert len(task_stub.calls) == 1
+        write(project / "sub" / "Taskfile.yml", "version: '3'\ntasks: {}\n")
+        tasks.get_tasks_summary()
+        assert len(task_stub.calls) == 2
+
+    def test_includes_are_not_parsed_without_the_disk_cache(
+        self, project, monkeypatch, make_converter
+    ):
+        def fingerprint(taskfile):
+            raise AssertionError("Taskfile includes were parsed")
+
+        monkeypatch.setattr(converter, "_taskfile_fingerprint", fingerprint)
+        make_converter(project).convert()
+
+
+class TestDiskCache:
+    def test_include_cycle_still_runs_the_task_command(
+        self, project, task_stub, make_converter
+    ):
+        write(project / "sub" / "Taskfile.yml", "version: '3'\nincludes:\n  up: ..\n")
+        make_converter(project, use_cache=True).get_tasks_summary()
+        assert task_stub.calls == [project / "Taskfile.yml"]
+
+    def test_cached_output_is_reused(self, project, task_stub, make_converter):
+        make_converter(project, use_cache=True).get_tasks_summary()
+        make_converter(project, use_cache=True).get_tasks_summary()
+        assert len(task_stub.calls) == 1
+
+    def test_editing_an_include_invalidates_the_cache(
+        self, project, task_stub, make_converter
+    ):
+        make_converter(project, use_cache=True).get_tasks_summary()
+        write(project / "sub" / "Taskfile.yml", "version: '3'\ntasks: {}\n")
+        make_converter(project, use_cache=True).get_tasks_summary()
+        assert len(task_stub.calls) == 2
+
+    def test_templated_include_is_never_cached(
+        self, project, task_stub, make_converter
+    ):
+        write(
+            project / "Taskfile.yml",
+            "version: '3'\nincludes:\n  os: ./Taskfile_{{OS}}.yml\n",
+        )
+        make_converter(project, use_cache=True).get_tasks_summary()
+        make_converter(project, use_cache=True).get_tasks_summary()
+        assert len(task_stub.calls) == 2
+
+    def test_cache_is_off_by_default(
+        self, project, task_stub, make_converter, tmp_path
+    ):
+        for _ in range(2):
+            make_converter(project).get_tasks_summary()
+        assert len(task_stub.calls) == 2
+        assert not (tmp_path / "cache").exists()
+
+    def test_edits_reuse_a_single_cache_file(
+        self, project, task_stub, make_converter, tmp_path
+    ):
+        for content in ["tasks: {}\n", "tasks: {a: {}}\n", "tasks: {b: {}}\n"]:
+            write(project / "sub" / "Taskfile.yml", "version: '3'\n" + content)
+            make_converter(project, use_cache=True).get_tasks_summary()
+        assert len(task_stub.calls) == 3
+        assert len(list((tmp_path / "cache" / "taskfile-to-tasks").iterdir())) == 1
+
+    def test_stale_cache_file_is_not_used(self, project, task_stub, make_converter):
+        cache = make_converter(project, use_cache=True)
+        cache.get_tasks_summary()
+        cache_file = cache._get_cache_file()
+        cache_file.write_text('{"key": [], "tasks": [{"task": "stale"}]}')
+        summary = make_converter(project, use_cache=True).get_tasks_summary()
+        assert summary == [{"id": "sub:lint", "description": ""}]
+        assert len(task_stub.calls) == 2
+
+    def test_tasks_are_loaded_from_the_cache(self, project, task_stub, make_converter):
+        make_converter(project, use_cache=True).get_tasks_summary()
+        summary = make_converter(project, use_cache=True).get_tasks_summary()
+        assert summary == [{"id": "sub:lint", "description": ""}]
+
+
+class TestLibyamlWarning:
+    def test_default_conversion_does_not_warn(
+        self, project, make_converter, no_libyaml
+    ):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            make_converter(project).convert()
+
+    def test_disk_cache_warns(self, project, make_converter, no_libyaml):
+        with pytest.warns(RuntimeWarning, match="libyaml"):
+            make_converter(project, use_cache=True).convert()
@@ -0,0 +1,98 @@
+"""Tests for parsing and merging extra editor options."""
+
+import pytest
+import yaml
+
+from taskfile_to_tasks.converter import (
+    _parse_simple_option,
+    merge_options,
+    parse_yaml_option,
+)
+
+# fmt: off
+# Options that the fast path handles, including values that look like YAML
+# constants but load as strings
+FAST_OPTIONS = [
+    "a: true", "a: Yes", "a: OFF", "a: ~", "a: Null", "a: nULL", "a: y",
+    "a: 1", "a: -0", "a: -1.5", "a: /tmp", "a: /a/b.c~+-", 'a: "x"',
+    'a: "über"', "a.b: shared", "a-b :  silent", "_x:  y",
+]
+# Options the fast path leaves to YAML, which would load them differently
+# from JSON or a plain string
+DEFERRED_OPTIONS = [
+    "a: 010", "a: 0x10", "a: 1_000", "a: +1", "a: 1.", "a: .5", "a: 1e3",
+    "a: .inf", "a: NaN", "a: Infinity", "a: 1:30", "a: 2001-12-14",
+    'a: "a\\nb"', "a: 's'", "a: <<", "a: über", "a: [1, 2]", "a: {a: 1}",
+    "a: x #c", "a: a b", "a:b", "a:\ttrue", "yes: 1", "True: 1", '"q": 1', "a: ",
+]
+# fmt: on
+
+
+def _same(left, right):
+    return left == right and [type(v) for v in left.values()] == [
+        type(v) for v in right.values()
+    ]
+
+
+@pytest.mark.parametrize("option", FAST_OPTIONS)
+def test_fast_path_matches_yaml(option):
+    fast = _parse_simple_option(option)
+    assert fast is not None
+    assert _same(fast, yaml.safe_load("{" + option + "}"))
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [
+        ("use_new_terminal: true", {"use_new_terminal": True}),
+        ("reveal: silent", {"reveal": "silent"}),
+        ("cwd: /tmp", {"cwd": "/tmp"}),
+        ("reveal_target: on", {"reveal_target": True}),
+        ("count: 3", {"count": 3}),
+        ('label: "a b"', {"label": "a b"}),
+    ],
+)
+def test_fast_path_handles_common_options(option, expected):
+    assert _same(_parse_simple_option(option), expected)
+
+
+@pytest.mark.parametrize("option", DEFERRED_OPTIONS)
+def test_fast_path_defers_to_yaml(option):
+    assert _parse_simple_option(option) is None
+
+
+@pytest.mark.parametrize("option", ["a: 010", "a: [1, 2]", "a: 1e3", "env: {1: a}"])
+def test_parse_yaml_option_matches_yaml(option):
+    assert _same(parse_yaml_option(option), yaml.safe_load("{" + option + "}"))
+
+
+def test_parse_yaml_option_returns_a_fresh_dict():
+    first = parse_yaml_option("a: 1")
+    first["b"] = 2
+    assert parse_yaml_option("a: 1") == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    "option, expected",
+    [("env: [1]", {"env": [1]}), ("env: {A: x}", {"env": {"A": "x"}})],
+)
+def test_parse_yaml_option_copies_nested_values(option, expected):
+    first = parse_yaml_option(option)
+    first["env"].clear()
+    assert parse_yaml_option(option) == expected
+
+
+@pytest.mark.parametrize("option", ["[1]", "a: [1", "a: {b"])
+def test_parse_yaml_option_rejects_invalid_options(option):
+    with pytest.raises(ValueError):
+        parse_yaml_option(option)
+
+
+def test_merge_options_later_options_win():
+    base = {"a": 1, "b": 2}
+    assert merge_options(base, [{"b": 3}, {"b": 4, "c": 5}]) == {
+        "a": 1,
+        "b": 4,
+        "c": 5,
+    }
+    assert base == {"a": 1, "b": 2}
@@ -0,0 +1,60 @@
+"""Tests for writing tasks.json."""
+
+import pytest
+
+from taskfile_to_tasks import converter
+
+TASK_OUTPUT = (
+    '{"tasks": [{"task": "build", "desc": "Build it"},'
+    ' {"task": "lint:ü", "desc": "Lint ✓"}, {"task": "test", "desc": ""}]}'
+).encode("utf-8")
+
+
+@pytest.fixture(autouse=True)
+def taskfile(task_stub, tmp_path):
+    task_stub.output = TASK_OUTPUT
+    (tmp_path / "Taskfile.yml").write_text("version: '3'\n")
+
+
+def convert_with_and_without_orjson(monkeypatch, make_converter, **kwargs):
+    outputs = []
+    for json_module in (converter.orjson, None):
+        monkeypatch.setattr(converter, "orjson", json_module)
+        outputs.append(make_converter(**kwargs).convert().read_bytes())
+    return outputs
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        [],
+        ["cwd: /tmp"],
+        ["env: {1: a, true: b, null: c}"],
+        ["big: 123456789012345678901234567890"],
+        ["inf: .inf", "nan: .nan"],
+        ["ratio: 1.5", "tiny: 1.0e-7", "huge: 1.0e+20"],
+        ["nested: [1, {a: [x, 2.5]}]"],
+    ],
+)
+@pytest.mark.parametrize("editor", ["zed", "vscode"])
+def test_output_does_not_depend_on_orjson(monkeypatch, make_converter, editor, options):
+    pytest.importorskip("orjson")
+    option_name = f"extra_{editor}_options"
+    with_orjson, without_orjson = convert_with_and_without_orjson(
+        monkeypatch, make_converter, editor=editor, **{option_name: options}
+    )
+    assert with_orjson == without_orjson
+
+
+def test_dates_fail_with_and_without_orjson(monkeypatch, make_converter):
+    pytest.importorskip("orjson")
+    for json_module in (converter.orjson, None):
+        monkeypatch.setattr(converter, "orjson", json_module)
+        with pytest.raises(TypeError):
+            make_converter(extra_zed_options=["when: 2001-12-14"]).convert()
+
+
+def test_non_ascii_is_written_as_utf8(monkeypatch, make_converter):
+    monkeypatch.setattr(converter, "orjson", None)
+    output = make_converter().convert().read_bytes().decode("utf-8")
+    assert '"lint:ü - Lint ✓"' in output